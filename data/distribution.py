@@ -1,6 +1,12 @@
 import os.path
+import copy
 import datetime
+import functools
+import hashlib
+import itertools
+import json
 import yaml
+import numpy as np
 import pandas as pd
 import logging
 import sys
@@ -10,6 +16,12 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Prefer the LibYAML C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # --- Configuration ---
 # SPREADSHEET_ID = '1ZkTB3ahmrQ2-7rz-h1RdkOMPSHmkAhpFJIH64Ca0jxk'  # Original spreadsheet ID (commented out)
 SPREADSHEET_ID = '1fRyGTX55EQwrQv7Lwakh1sNhnG8hg5yDjvuWw_dJqbk'  # Fake spreadsheet for testing
@@ -18,9 +30,15 @@ REPORT_SHEET_NAME = 'Stakeholder Report'
 SETTINGS_FILE = 'settings.yaml'  # Changed from '../settings.yaml' to 'settings.yaml'
 SERVICE_ACCOUNT_FILE = 'carbon-pride-374002-2dc0cf329724.json'
 
+# Sidecar file holding the digest of the last report written for a date
+REPORT_CACHE_FILE = '.report_cache_{date}.txt'
+
 # Scopes required for reading and writing
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets'] # Correct scope
 
+# Developer metadata key used to tag the rows of each daily report section
+REPORT_METADATA_KEY = 'stakeholder_report_date'
+
 # Define call status priorities and report categories
 CALL_PRIORITIES = {
     1: ["NDR"],
@@ -28,6 +46,7 @@ CALL_PRIORITIES = {
     3: ["Call didn't Pick", "Follow up"],
     4: ["Abandoned", "Number invalid/fake order"]
 }
+ALL_PRIORITY_STATUSES = frozenset(status for priority_list in CALL_PRIORITIES.values() for status in priority_list)
 
 # MODIFIED: Split 'Abandoned' and 'Number invalid/fake order' for reporting
 STATUS_TO_REPORT_CATEGORY = {
@@ -57,6 +76,8 @@ COL_NAMES = {
     'customer_id': 'Id (Customer)',
     # ... potentially more columns based on your full header ...
 }
+# Columns that are compared against status/date strings or written back to the sheet
+STRING_COL_KEYS = ['call_status', 'stakeholder', 'date_col', 'date_col_2', 'date_col_3']
 
 # --- Logging Setup ---
 LOG_FILE = 'distribution_script.log'
@@ -71,17 +92,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # --- Load Settings Function ---
+@functools.lru_cache(maxsize=8)
+def _load_settings_cached(path, mtime_ns, size):
+    """Parses a YAML file. Keyed on (path, mtime, size) so edits invalidate the entry."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 def load_settings(filename):
     """Loads configuration from a YAML file."""
     logger.info(f"Loading settings from '{filename}'...")
     try:
-        with open(filename, 'r') as f:
-            settings = yaml.safe_load(f)
+        st = os.stat(filename)
+        settings = _load_settings_cached(os.path.abspath(filename), st.st_mtime_ns, st.st_size)
         if not settings:
              logger.warning(f"Settings file '{filename}' is empty.")
              return None
         logger.info(f"Settings loaded successfully from '{filename}'.")
-        return settings
+        # Hand out a copy so callers can't mutate the cached entry
+        return copy.deepcopy(settings)
     except FileNotFoundError:
         logger.error(f"Error: Settings file '{filename}' not found.")
         return None
@@ -92,6 +120,27 @@ def load_settings(filename):
         logger.error(f"An unexpected error occurred loading settings: {e}")
         return None
 
+# --- Report digest cache ---
+def compute_report_digest(formatted_report_values):
+    """Returns a content hash of the formatted report rows."""
+    return hashlib.blake2b(json.dumps(formatted_report_values).encode('utf-8')).hexdigest()
+
+def read_report_digest(report_date_str):
+    """Returns the digest of the last report written for the date, or None if there is none."""
+    try:
+        with open(REPORT_CACHE_FILE.format(date=report_date_str), 'r') as f:
+            return f.readline().strip() or None
+    except OSError:
+        return None
+
+def write_report_digest(report_date_str, digest):
+    """Records the digest of a report just written for the date, with a timestamp."""
+    try:
+        with open(REPORT_CACHE_FILE.format(date=report_date_str), 'w') as f:
+            f.write(f"{digest}\n{datetime.datetime.now().isoformat()}\n")
+    except OSError as e:
+        logger.warning(f"Could not write report cache file: {e}")
+
 # --- Helper function ---
 def col_index_to_a1(index):
     col = ''
@@ -100,9 +149,19 @@ def col_index_to_a1(index):
         index = index // 26 - 1
     return col
 
+# Precomputed A1 column letters (A..DX); the Orders header read is capped at BD
+_A1_COLS = tuple(col_index_to_a1(i) for i in range(128))
+
 # --- Authentication ---
+# Sheets service built on first use and reused for the rest of the process
+_service = None
+
 def authenticate_google_sheets():
-    """Authenticates using a service account key file."""
+    """Authenticates using a service account key file. The built service is cached per process."""
+    global _service
+    if _service is not None:
+        return _service
+
     creds = None
     logger.info(f"Loading service account credentials from '{SERVICE_ACCOUNT_FILE}'...")
     try:
@@ -118,8 +177,9 @@ def authenticate_google_sheets():
 
     logger.info("Building Google Sheets API service...")
     try:
-        service = build('sheets', 'v4', credentials=creds)
-        return service
+        # Use the discovery document bundled with googleapiclient instead of fetching it over HTTPS
+        _service = build('sheets', 'v4', credentials=creds, cache_discovery=False, static_discovery=True)
+        return _service
     except HttpError as e:
          logger.error(f"Google Sheets API Error during service build: {e}")
          logger.error("Ensure the service account has Editor access to the spreadsheet.")
@@ -128,18 +188,103 @@ def authenticate_google_sheets():
          logger.error(f"Unexpected error during service build: {e}")
          return None
 
+# --- Report sheet metadata helpers ---
+# Numeric sheetIds keyed by (spreadsheet_id, sheet_title), filled on first lookup
+_sheet_id_cache = {}
+
+def get_sheet_id(sheet, spreadsheet_id, sheet_title):
+    """
+    Returns the numeric sheetId for a sheet title, or None if no such sheet exists.
+    Ids are cached per process; a single metadata fetch fills the cache for every sheet.
+    """
+    cache_key = (spreadsheet_id, sheet_title)
+    if cache_key not in _sheet_id_cache:
+        meta = sheet.get(spreadsheetId=spreadsheet_id, fields='sheets(properties(sheetId,title))').execute()
+        for sheet_meta in meta.get('sheets', []):
+            _sheet_id_cache[(spreadsheet_id, sheet_meta['properties']['title'])] = sheet_meta['properties']['sheetId']
+    return _sheet_id_cache.get(cache_key)
+
+def forget_sheet_id(spreadsheet_id, sheet_title):
+    """Drops a cached sheetId, e.g. after the sheet was (re)created or a request using it failed."""
+    _sheet_id_cache.pop((spreadsheet_id, sheet_title), None)
+
+def build_report_metadata_requests(sheet_id, start_row, num_rows, report_date_str):
+    """
+    Builds batchUpdate requests that (re)tag rows start_row..start_row+num_rows-1 (1-based)
+    as the report section for report_date_str. Any previous tag for that date is dropped first.
+    """
+    return [
+        {'deleteDeveloperMetadata': {'dataFilter': {'developerMetadataLookup': {
+            'metadataKey': REPORT_METADATA_KEY, 'metadataValue': report_date_str}}}},
+        {'createDeveloperMetadata': {'developerMetadata': {
+            'metadataKey': REPORT_METADATA_KEY,
+            'metadataValue': report_date_str,
+            'location': {'dimensionRange': {
+                'sheetId': sheet_id, 'dimension': 'ROWS',
+                'startIndex': start_row - 1, 'endIndex': start_row - 1 + num_rows}},
+            'visibility': 'DOCUMENT'}}},
+    ]
+
+def tag_report_rows(sheet, spreadsheet_id, sheet_id, start_row, num_rows, report_date_str):
+    """Attaches the report-date developer metadata to a report section. Failures are logged, not raised."""
+    if sheet_id is None:
+        logger.warning("Report sheet id unknown. Skipping report metadata tag.")
+        return
+    try:
+        body = {'requests': build_report_metadata_requests(sheet_id, start_row, num_rows, report_date_str)}
+        sheet.batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute()
+        logger.info(f"Tagged report rows {start_row}-{start_row + num_rows - 1} with metadata for {report_date_str}.")
+    except HttpError as e:
+        logger.warning(f"API Error while tagging report rows with metadata: {e}")
+
+def find_report_range_by_metadata(sheet, spreadsheet_id, today_date_str):
+    """
+    Looks up today's report section through its developer metadata tag.
+    Returns (start_row_1based, end_row_1based) if tagged, otherwise (None, None).
+    """
+    body = {'dataFilters': [{'developerMetadataLookup': {
+        'metadataKey': REPORT_METADATA_KEY, 'metadataValue': today_date_str}}]}
+    try:
+        result = sheet.developerMetadata().search(spreadsheetId=spreadsheet_id, body=body).execute()
+    except HttpError as e:
+        logger.warning(f"Developer metadata search failed, falling back to column scan: {e}")
+        return None, None
+
+    ranges = [
+        match['developerMetadata']['location']['dimensionRange']
+        for match in result.get('matchedDeveloperMetadata', [])
+        if 'dimensionRange' in match.get('developerMetadata', {}).get('location', {})
+    ]
+    if not ranges:
+        return None, None
+
+    dimension_range = min(ranges, key=lambda r: r.get('startIndex', 0))
+    start_row = dimension_range.get('startIndex', 0) + 1
+    end_row = max(start_row, dimension_range.get('endIndex', start_row))
+    logger.info(f"Found existing report for {today_date_str} via metadata at rows {start_row}-{end_row}.")
+    return start_row, end_row
+
 # --- Function to find an existing report range for today ---
 def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_date_str):
     """
     Searches the report sheet for a report section starting with today's date.
-    Returns (start_row_1based, end_row_1based) if found, otherwise (None, None).
-    The end_row is the last row of the section to be cleared/overwritten.
+    Returns (start_row_1based, end_row_1based, last_row_in_sheet, column_a_values).
+    start_row/end_row are None if no section was found; the end_row is the last row
+    of the section to be cleared/overwritten.
+    Sections tagged with developer metadata are resolved server-side; untagged
+    (older) sections fall back to scanning column A for the title marker.
+    last_row_in_sheet and column_a_values come from that scan so callers can reuse
+    them (e.g. to find the append position); both are None when column A wasn't read.
     """
     start_title = f"--- Stakeholder Report for Assignments on {today_date_str} ---"
     any_report_start_pattern = "--- Stakeholder Report for Assignments on "
 
     logger.info(f"Searching for existing report section for {today_date_str} in '{report_sheet_name}'...")
 
+    start_row, end_row = find_report_range_by_metadata(sheet, spreadsheet_id, today_date_str)
+    if start_row is not None:
+        return start_row, end_row, None, None
+
     start_row = None # 1-based index of today's report start
     next_start_row = None # Initialize to None
     last_row_in_sheet = 0
@@ -151,7 +296,7 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
         ).execute()
         values = result.get('values', [])
         last_row_in_sheet = len(values)
-        logger.debug(f"Read {last_row_in_sheet} rows from column A of '{report_sheet_name}'.")
+        logger.debug("Read %s rows from column A of '%s'.", last_row_in_sheet, report_sheet_name)
 
         # Find the start of today's report
         for i in range(last_row_in_sheet):
@@ -163,7 +308,7 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
 
         if start_row is None:
             logger.info(f"No existing report found for {today_date_str}.")
-            return None, None # Not found
+            return None, None, last_row_in_sheet, values # Not found
 
         # Search for the start of the *next* report section after today's report started
         # Iterate from the row *after* today's report start
@@ -171,34 +316,34 @@ def find_existing_report_range(sheet, spreadsheet_id, report_sheet_name, today_d
              row_value = values[i][0].strip() if values[i] and values[i][0] else ''
              if row_value.startswith(any_report_start_pattern):
                   next_start_row = i + 1 # 1-based index of the next start
-                  logger.debug(f"Found start of next report section at row {next_start_row}.")
+                  logger.debug("Found start of next report section at row %s.", next_start_row)
                   break # Found the next one, stop searching
 
         # Determine the end row for clearing: 1 row before the next report start, or the last row of the sheet
         if next_start_row is not None:
              # Clear from the start of today's report up to the row just before the next report starts.
              end_row_to_clear = next_start_row - 1
-             logger.debug(f"Calculated clear end row based on next report start: {end_row_to_clear}")
+             logger.debug("Calculated clear end row based on next report start: %s", end_row_to_clear)
         else:
              # Clear from the start of today's report to the very last row of the sheet that has data.
              end_row_to_clear = last_row_in_sheet
-             logger.debug(f"Calculated clear end row based on end of sheet: {end_row_to_clear}")
+             logger.debug("Calculated clear end row based on end of sheet: %s", end_row_to_clear)
 
         # Ensure end_row_to_clear is not less than start_row (handles edge case if markers are right next to each other or sheet ends immediately)
         end_row_to_clear = max(start_row, end_row_to_clear)
 
-        return start_row, end_row_to_clear
+        return start_row, end_row_to_clear, last_row_in_sheet, values
 
     except HttpError as e:
         if 'Unable to parse range' in str(e) or e.resp.status == 400:
             logger.warning(f"Sheet '{report_sheet_name}' not found when searching for existing report. It will be created on write.")
-            return None, None # Sheet doesn't exist, no existing report
+            return None, None, None, None # Sheet doesn't exist, no existing report
         else:
             logger.error(f"Google Sheets API Error while searching for existing report: {e}")
             raise # Re-raise other errors
     except Exception as e:
         logger.exception(f"Unexpected error while searching for existing report:")
-        return None, None # Treat unexpected errors as "not found" for robustness
+        return None, None, None, None # Treat unexpected errors as "not found" for robustness
 
 
 # --- Main Processing Function ---
@@ -223,66 +368,80 @@ def distribute_and_report():
     sheet = service.spreadsheets()
 
     try:
-        # --- Read Data ---
-        logger.info(f"Reading data from '{ORDERS_SHEET_NAME}'...")
-        # Read a wider range to ensure Date 2 and Date 3 columns are captured if they exist beyond AZ
-        read_range = f'{ORDERS_SHEET_NAME}!A:BD' # Increased range to BD (56 columns)
-        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=read_range).execute()
-        values = result.get('values', [])
+        # --- Read Header ---
+        logger.info(f"Reading header from '{ORDERS_SHEET_NAME}'...")
+        # Header scan spans A:BD to ensure Date 2 and Date 3 columns are captured if they exist beyond AZ
+        header_row = HEADER_ROW_INDEX + 1
+        header_range = f'{ORDERS_SHEET_NAME}!A{header_row}:BD{header_row}'
+        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=header_range).execute()
+        header_values = result.get('values', [])
+
+        if not header_values:
+            logger.warning(f"No header found in '{ORDERS_SHEET_NAME}' (row {header_row}).")
+            return None
 
-        if not values:
-            logger.warning(f"No data found in '{ORDERS_SHEET_NAME}'.")
+        header = [str(h).strip() if h is not None else '' for h in header_values[0]]
+        header_length = len(header)
+        logger.info(f"Header row (row {header_row}) with {header_length} columns identified.")
+
+        # --- Read Only the Needed Columns ---
+        # One range per column the script reads or writes, instead of the whole A:BD block
+        needed_columns = [col_name for col_name in dict.fromkeys(COL_NAMES.values()) if col_name in header]
+        if not needed_columns:
+            logger.error(f"None of the expected columns were found in the '{ORDERS_SHEET_NAME}' header. Aborting.")
             return None
 
-        logger.info(f"Read {len(values)} rows from '{ORDERS_SHEET_NAME}'.")
+        data_start_row = DATA_START_ROW_INDEX + 1
+        column_ranges = []
+        for col_name in needed_columns:
+            col_a1 = _A1_COLS[header.index(col_name)]
+            column_ranges.append(f'{ORDERS_SHEET_NAME}!{col_a1}{data_start_row}:{col_a1}')
+
+        logger.info(f"Reading {len(column_ranges)} columns from '{ORDERS_SHEET_NAME}'...")
+        # Unformatted values come back as native JSON numbers/booleans; dates stay formatted strings
+        result = sheet.values().batchGet(
+            spreadsheetId=SPREADSHEET_ID, ranges=column_ranges, majorDimension='COLUMNS',
+            valueRenderOption='UNFORMATTED_VALUE', dateTimeRenderOption='FORMATTED_STRING').execute()
+        column_values = [
+            (value_range.get('values') or [[]])[0] for value_range in result.get('valueRanges', [])
+        ]
+
+        # Trailing empty cells are trimmed per column, so the row count is the longest column
+        num_rows = max((len(col) for col in column_values), default=0)
+        if num_rows == 0:
+            logger.error(f"No data rows in '{ORDERS_SHEET_NAME}' starting at row {data_start_row}.")
+            return None
 
-        if len(values) < DATA_START_ROW_INDEX + 1:
-             logger.error(f"Not enough rows in '{ORDERS_SHEET_NAME}'. Need at least {DATA_START_ROW_INDEX + 1}. Found {len(values)}.")
-             return None
+        # --- Build DataFrame from Column Arrays ---
+        df = pd.DataFrame({
+            col_name: list(col) + [''] * (num_rows - len(col))
+            for col_name, col in zip(needed_columns, column_values)
+        })
+        # Only the columns the assignment logic compares or writes back are coerced to stripped strings
+        for col_key in STRING_COL_KEYS:
+            col_name = COL_NAMES[col_key]
+            if col_name in df.columns:
+                df[col_name] = df[col_name].astype(str).str.strip()
+
+        logger.info(f"Processed {len(df)} data rows.")
 
-        header = [str(h).strip() if h is not None else '' for h in values[HEADER_ROW_INDEX]]
-        header_length = len(header)
-        logger.info(f"Header row (row {HEADER_ROW_INDEX + 1}) with {header_length} columns identified.")
-
-        # --- Pad Data Rows ---
-        data_rows_raw = values[DATA_START_ROW_INDEX:]
-        padded_data_rows = []
-        for i, row in enumerate(data_rows_raw):
-            processed_row = [str(cell).strip() if cell is not None else '' for cell in row]
-            if len(processed_row) < header_length:
-                processed_row.extend([''] * (header_length - len(processed_row)))
-            elif len(processed_row) > header_length:
-                 logger.warning(f"Row {DATA_START_ROW_INDEX + i + 1} has more columns ({len(processed_row)}) than header ({header_length}). Truncating to {header_length}.")
-                 processed_row = processed_row[:header_length]
-            padded_data_rows.append(processed_row)
-
-        logger.info(f"Processed {len(padded_data_rows)} data rows.")
-
-        df = pd.DataFrame(padded_data_rows, columns=header)
         df['_original_row_index'] = range(DATA_START_ROW_INDEX + 1, DATA_START_ROW_INDEX + 1 + len(df))
         logger.info(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns.")
 
         # --- Prepare DataFrame Columns ---
-        # Ensure required columns exist in DataFrame, adding them if necessary
-        for col_key, col_name in COL_NAMES.items():
+        # Ensure required columns exist in DataFrame, adding them if necessary.
+        # The status, stakeholder and date columns read from the sheet are already stripped strings.
+        for col_name in COL_NAMES.values():
             if col_name not in df.columns:
                 logger.warning(f"Column '{col_name}' not found in DataFrame after reading. Adding it as an empty column.")
                 df[col_name] = ''
-            # Ensure all relevant columns are string type for consistency
-            df[col_name] = df[col_name].astype(str)
-
-        # Clean up status column
-        df[COL_NAMES['call_status']] = df[COL_NAMES['call_status']].fillna('').astype(str).str.strip()
-
 
         # --- Filter Rows for Processing ---
         logger.info("Filtering rows based on priority statuses...")
-        all_priority_statuses = [status for priority_list in CALL_PRIORITIES.values() for status in priority_list]
-        rows_to_process_df = df[df[COL_NAMES['call_status']].isin(all_priority_statuses)].copy()
+        filtered_mask = df[COL_NAMES['call_status']].isin(ALL_PRIORITY_STATUSES)
 
-        logger.info(f"Found {len(rows_to_process_df)} rows matching priority statuses for potential assignment/date update.")
-
-        filtered_indices = rows_to_process_df.index.tolist() # Indices in the original df
+        filtered_indices = df.index[filtered_mask].tolist() # Indices in the original df
+        logger.info(f"Found {len(filtered_indices)} rows matching priority statuses for potential assignment/date update.")
 
         if not filtered_indices:
             logger.info("No rows matched filter criteria. Skipping assignments and report.")
@@ -296,38 +455,36 @@ def distribute_and_report():
             logger.info(f"Processing {len(filtered_indices)} filtered rows for assignments and date tracking.")
 
             # Assign stakeholders cyclically to ALL filtered rows first
-            assigned_stakeholders = [stakeholder_list[i % num_stakeholders] for i in range(len(filtered_indices))]
-            df.loc[filtered_indices, COL_NAMES['stakeholder']] = assigned_stakeholders
-            logger.info(f"Stakeholders assigned cyclically to {len(filtered_indices)} rows.")
-
-            # Now handle date assignments row by row for the filtered indices
-            for i, df_index in enumerate(filtered_indices):
-                row_data = df.loc[df_index] # Get the current state from the main df
-                call_status = row_data.get(COL_NAMES['call_status'], '').strip()
-
-                # Read existing date values as strings
-                date1_val = str(row_data.get(COL_NAMES['date_col'], '')).strip()
-                date2_val = str(row_data.get(COL_NAMES['date_col_2'], '')).strip()
-                date3_val = str(row_data.get(COL_NAMES['date_col_3'], '')).strip()
-
-                if call_status == "Call didn't Pick":
-                    if not date1_val:
-                        df.loc[df_index, COL_NAMES['date_col']] = today_date_str_for_sheet
-                        logger.debug(f"Row {row_data['_original_row_index']}: CNP, 1st attempt. Set Date to {today_date_str_for_sheet}.")
-                    elif not date2_val:
-                        df.loc[df_index, COL_NAMES['date_col_2']] = today_date_str_for_sheet
-                        logger.debug(f"Row {row_data['_original_row_index']}: CNP, 2nd attempt. Set Date 2 to {today_date_str_for_sheet}.")
-                    elif not date3_val:
-                        df.loc[df_index, COL_NAMES['date_col_3']] = today_date_str_for_sheet
-                        logger.debug(f"Row {row_data['_original_row_index']}: CNP, 3rd attempt. Set Date 3 to {today_date_str_for_sheet}.")
-                    else:
-                         logger.debug(f"Row {row_data['_original_row_index']}: CNP, 3 attempts already logged. Dates unchanged.")
-
-                else:
-                    # Status is in prioritized list but not CNP
-                    df.loc[df_index, COL_NAMES['date_col']] = today_date_str_for_sheet
-                    # Note: Date 2 and Date 3 are NOT cleared based on Apps Script behavior observation
-                    logger.debug(f"Row {row_data['_original_row_index']}: Status '{call_status}'. Set Date to {today_date_str_for_sheet}.")
+            num_filtered = int(filtered_mask.sum())
+            stakeholder_arr = np.asarray(stakeholder_list, dtype=object)
+            df.loc[filtered_mask, COL_NAMES['stakeholder']] = stakeholder_arr[np.arange(num_filtered) % num_stakeholders]
+            logger.info(f"Stakeholders assigned cyclically to {num_filtered} rows.")
+
+            # Now handle date assignments for the filtered rows with boolean masks.
+            # Masks are computed up front; each row only ever touches its own cells.
+            cnp_mask = filtered_mask & (df[COL_NAMES['call_status']] == "Call didn't Pick")
+            date1_empty = df[COL_NAMES['date_col']] == ''
+            date2_empty = df[COL_NAMES['date_col_2']] == ''
+            date3_empty = df[COL_NAMES['date_col_3']] == ''
+
+            # CNP: fill the first empty attempt slot of Date, Date 2, Date 3
+            cnp_first = cnp_mask & date1_empty
+            cnp_second = cnp_mask & ~date1_empty & date2_empty
+            cnp_third = cnp_mask & ~date1_empty & ~date2_empty & date3_empty
+            df.loc[cnp_first, COL_NAMES['date_col']] = today_date_str_for_sheet
+            df.loc[cnp_second, COL_NAMES['date_col_2']] = today_date_str_for_sheet
+            df.loc[cnp_third, COL_NAMES['date_col_3']] = today_date_str_for_sheet
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CNP rows: %d 1st attempt, %d 2nd attempt, %d 3rd attempt, %d with 3 attempts already logged.",
+                             cnp_first.sum(), cnp_second.sum(), cnp_third.sum(),
+                             (cnp_mask & ~date1_empty & ~date2_empty & ~date3_empty).sum())
+
+            # Status is in prioritized list but not CNP
+            # Note: Date 2 and Date 3 are NOT cleared based on Apps Script behavior observation
+            other_mask = filtered_mask & ~cnp_mask
+            df.loc[other_mask, COL_NAMES['date_col']] = today_date_str_for_sheet
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Non-CNP rows: set Date to %s on %d rows.", today_date_str_for_sheet, other_mask.sum())
 
             logger.info(f"Date logic applied to {len(filtered_indices)} rows.")
 
@@ -344,38 +501,53 @@ def distribute_and_report():
                     col_index = header.index(col_name)
                     sheet_col_indices[col_name] = col_index
                     max_col_index_to_write = max(max_col_index_to_write, col_index)
-                    logger.debug(f"Found column '{col_name}' at index {col_index}.")
+                    logger.debug("Found column '%s' at index %s.", col_name, col_index)
                 except ValueError:
                     logger.warning(f"Column '{col_name}' not found in the sheet header row. Cannot write to this column.")
                     sheet_col_indices[col_name] = -1 # Mark as not found
 
             if max_col_index_to_write != -1:
-                for df_index in filtered_indices:
-                    original_sheet_row = df.loc[df_index, '_original_row_index']
-                    row_data = df.loc[df_index] # Get the potentially updated data
-
-                    # Create a list for the row values, padded up to the max column index needed
-                    row_values_to_write = [None] * (max_col_index_to_write + 1)
-
-                    # Place the values at their correct sheet column indices if the column was found
-                    if sheet_col_indices.get(COL_NAMES['stakeholder'], -1) != -1:
-                        row_values_to_write[sheet_col_indices[COL_NAMES['stakeholder']]] = row_data.get(COL_NAMES['stakeholder'], '')
-
-                    if sheet_col_indices.get(COL_NAMES['date_col'], -1) != -1:
-                        row_values_to_write[sheet_col_indices[COL_NAMES['date_col']]] = row_data.get(COL_NAMES['date_col'], '')
-
-                    if sheet_col_indices.get(COL_NAMES['date_col_2'], -1) != -1:
-                        row_values_to_write[sheet_col_indices[COL_NAMES['date_col_2']]] = row_data.get(COL_NAMES['date_col_2'], '')
-
-                    if sheet_col_indices.get(COL_NAMES['date_col_3'], -1) != -1:
-                        row_values_to_write[sheet_col_indices[COL_NAMES['date_col_3']]] = row_data.get(COL_NAMES['date_col_3'], '')
-
+                # Only send the column span that is actually written, not everything from column A
+                min_col_index_to_write = min(idx for idx in sheet_col_indices.values() if idx != -1)
+                span_width = max_col_index_to_write - min_col_index_to_write + 1
+                span_start_a1 = _A1_COLS[min_col_index_to_write]
+                span_end_a1 = _A1_COLS[max_col_index_to_write]
+
+                # Materialize only the written columns once, as (span offset, values array) pairs
+                write_columns = [
+                    (sheet_col_indices[col_name] - min_col_index_to_write, df[col_name].to_numpy())
+                    for col_name in cols_to_update_names
+                    if sheet_col_indices.get(col_name, -1) != -1
+                ]
+                filtered_positions = np.flatnonzero(filtered_mask.to_numpy())
+                sheet_rows = df['_original_row_index'].to_numpy()[filtered_positions].tolist()
+
+                # Group consecutive sheet rows into runs so each run becomes a single range
+                row_runs = itertools.groupby(
+                    zip(sheet_rows, filtered_positions),
+                    key=lambda pair, counter=itertools.count(): pair[0] - next(counter)
+                )
+
+                for _, run in row_runs:
+                    run = list(run)
+                    run_values = []
+                    for _, position in run:
+                        # Create a list for the row values covering the written column span
+                        row_values_to_write = [None] * span_width
+
+                        # Place the values at their correct sheet column offsets
+                        for offset, column_array in write_columns:
+                            row_values_to_write[offset] = column_array[position]
+
+                        run_values.append(row_values_to_write)
+
+                    first_sheet_row, last_sheet_row = run[0][0], run[-1][0]
                     updates.append({
-                        'range': f'{ORDERS_SHEET_NAME}!A{original_sheet_row}',
-                        'values': [row_values_to_write]
+                        'range': f'{ORDERS_SHEET_NAME}!{span_start_a1}{first_sheet_row}:{span_end_a1}{last_sheet_row}',
+                        'values': run_values
                     })
 
-                logger.info(f"Prepared {len(updates)} row updates for Orders sheet batch write.")
+                logger.info(f"Prepared {len(updates)} range updates covering {len(filtered_indices)} rows for Orders sheet batch write.")
             else:
                  logger.warning("No writeable columns found in header. No Orders sheet updates prepared.")
 
@@ -396,59 +568,44 @@ def distribute_and_report():
             # --- Generate Stakeholder Report for THIS RUN (MODIFIED) ---
             logger.info("Generating Stakeholder Report for this batch...")
 
-            # Initialize report counts structure, including the new category
-            report_counts = {}
-            for stakeholder in stakeholder_list:
-                report_counts[stakeholder] = {
-                    "Total": 0,
-                    "Fresh": 0,
-                    "Abandoned": 0,
-                    "Invalid/Fake": 0, # Added the new category here
-                    "CNP": 0,
-                    "Follow up": 0,
-                    "NDR": 0
-                }
-            logger.info("Initialized report counts structure.")
+            # Define the order of categories for the report output
+            report_category_order = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"] # Added Invalid/Fake here
 
             # Count calls for each stakeholder based ONLY on the rows that were just filtered and assigned
-            assigned_rows_processed_count = 0
-            for index, row_in_filtered_df in rows_to_process_df.iterrows():
-                 assigned_stakeholder = df.loc[index, COL_NAMES['stakeholder']]
-                 call_status = row_in_filtered_df.get(COL_NAMES['call_status'], '').strip()
+            assigned_df = df.loc[filtered_mask, [COL_NAMES['stakeholder'], COL_NAMES['call_status']]].copy()
+            assigned_df['report_category'] = assigned_df[COL_NAMES['call_status']].map(STATUS_TO_REPORT_CATEGORY)
+            stakeholder_names = list(dict.fromkeys(stakeholder_list))
+            report_pivot = (
+                assigned_df.groupby([COL_NAMES['stakeholder'], 'report_category']).size()
+                .unstack(fill_value=0)
+                .reindex(index=stakeholder_names, columns=report_category_order, fill_value=0)
+            )
+            # Total is the sum of the defined categories (including 'Invalid/Fake') for this run
+            report_totals = report_pivot.sum(axis=1)
 
-                 if assigned_stakeholder in report_counts:
-                     assigned_rows_processed_count += 1
-                     report_category = STATUS_TO_REPORT_CATEGORY.get(call_status)
-                     if report_category:
-                         report_counts[assigned_stakeholder][report_category] += 1
+            report_counts = {}
+            for stakeholder in stakeholder_names:
+                report_counts[stakeholder] = {"Total": int(report_totals.at[stakeholder])}
+                for category in report_category_order:
+                    report_counts[stakeholder][category] = int(report_pivot.at[stakeholder, category])
+            assigned_rows_processed_count = int(report_totals.sum())
 
             logger.info(f"Calculated report counts for {assigned_rows_processed_count} rows processed and assigned in this run.")
 
             # Format the report data for writing using the original Apps Script format (MODIFIED)
-            formatted_report_values = []
-            formatted_report_values.append([f"--- Stakeholder Report for Assignments on {today_date_str_for_report} ---"])
-            formatted_report_values.append([''])
-
-            # Define the order of categories for the report output
-            report_category_order = ["Fresh", "Abandoned", "Invalid/Fake", "CNP", "Follow up", "NDR"] # Added Invalid/Fake here
-
-            for stakeholder in stakeholder_list:
-                 # Calculate Total based on the sum of categories for this stakeholder in this run
-                 # MODIFIED: Include 'Invalid/Fake' in the total sum
-                 total_assigned_this_run = sum(report_counts[stakeholder].get(cat, 0) for cat in report_category_order) # Sum only defined categories
-                 report_counts[stakeholder]["Total"] = total_assigned_this_run
-
-                 formatted_report_values.append([f"Calls assigned {stakeholder}"])
-                 formatted_report_values.append([f"- Total Calls This Run - {report_counts[stakeholder]['Total']}"])
-
-                 # Append categories in the defined order
-                 for category in report_category_order:
-                     # Use .get(category, 0) in case a category somehow wasn't initialized (shouldn't happen, but safe)
-                     formatted_report_values.append([f"- {category}- {report_counts[stakeholder].get(category, 0)}"])
-
-                 formatted_report_values.append(['']) # Blank line after each stakeholder block
-
-            formatted_report_values.append(['--- End of Report for ' + today_date_str_for_report + ' ---'])
+            report_header_rows = [[f"--- Stakeholder Report for Assignments on {today_date_str_for_report} ---"], ['']]
+            stakeholder_blocks = [
+                [
+                    [f"Calls assigned {stakeholder}"],
+                    [f"- Total Calls This Run - {report_counts[stakeholder]['Total']}"],
+                    # Categories in the defined order
+                    *[[f"- {category}- {report_counts[stakeholder][category]}"] for category in report_category_order],
+                    [''], # Blank line after each stakeholder block
+                ]
+                for stakeholder in stakeholder_list
+            ]
+            report_footer_rows = [[f"--- End of Report for {today_date_str_for_report} ---"]]
+            formatted_report_values = list(itertools.chain(report_header_rows, *stakeholder_blocks, report_footer_rows))
 
             logger.info(f"Formatted report data ({len(formatted_report_values)} rows).")
 
@@ -456,30 +613,55 @@ def distribute_and_report():
             logger.info(f"Writing report to '{REPORT_SHEET_NAME}'...")
 
             # Use the same today_date_str for finding existing report
-            start_row_existing, end_row_existing = find_existing_report_range(
+            start_row_existing, end_row_existing, report_last_row, _ = find_existing_report_range(
                 sheet, SPREADSHEET_ID, REPORT_SHEET_NAME, today_date_str_for_report
             )
 
-            if start_row_existing is not None and end_row_existing is not None:
+            report_digest = compute_report_digest(formatted_report_values)
+            report_exists = start_row_existing is not None and end_row_existing is not None
+
+            if report_exists and read_report_digest(today_date_str_for_report) == report_digest:
+                # --- Existing Report Unchanged ---
+                logger.info(f"Report for {today_date_str_for_report} unchanged since last write; skipping write.")
+
+            elif report_exists:
                 # --- Update Existing Report ---
                 logger.info(f"Existing report for {today_date_str_for_report} found. Updating range {REPORT_SHEET_NAME}!A{start_row_existing}:Z{end_row_existing}...")
-                range_to_clear = f'{REPORT_SHEET_NAME}!A{start_row_existing}:Z{end_row_existing}'
-                range_to_write_new = f'{REPORT_SHEET_NAME}!A{start_row_existing}'
 
                 try:
-                    logger.info(f"Clearing range: {range_to_clear}")
-                    sheet.values().clear(spreadsheetId=SPREADSHEET_ID, range=range_to_clear).execute()
-                    logger.info("Cleared old report data.")
-
-                    logger.info(f"Writing new report data to range: {range_to_write_new}")
-                    body = {'values': formatted_report_values}
-                    result = sheet.values().update(
-                        spreadsheetId=SPREADSHEET_ID, range=range_to_write_new,
-                        valueInputOption='RAW', body=body).execute()
-                    logger.info(f"Report updated. {result.get('updatedCells', 'N/A')} cells updated.")
+                    report_sheet_id = get_sheet_id(sheet, SPREADSHEET_ID, REPORT_SHEET_NAME)
+                    if report_sheet_id is None:
+                        raise ValueError(f"Sheet '{REPORT_SHEET_NAME}' not found while updating report.")
+
+                    # Clear the old section (A:Z) and write the new one in a single batchUpdate round-trip
+                    report_requests = [
+                        {'updateCells': {
+                            'range': {'sheetId': report_sheet_id,
+                                      'startRowIndex': start_row_existing - 1, 'endRowIndex': end_row_existing,
+                                      'startColumnIndex': 0, 'endColumnIndex': 26},
+                            'fields': 'userEnteredValue'}},
+                        {'updateCells': {
+                            'rows': [{'values': [{'userEnteredValue': {'stringValue': value}} for value in row]}
+                                     for row in formatted_report_values],
+                            'start': {'sheetId': report_sheet_id, 'rowIndex': start_row_existing - 1, 'columnIndex': 0},
+                            'fields': 'userEnteredValue'}},
+                    ]
+
+                    logger.info(f"Clearing rows {start_row_existing}-{end_row_existing} and writing {len(formatted_report_values)} report rows.")
+                    sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body={'requests': report_requests}).execute()
+                    logger.info("Report updated.")
+                    write_report_digest(today_date_str_for_report, report_digest)
+
+                    # Re-tag the section if its length changed. Kept out of the batchUpdate above
+                    # so a metadata failure can't roll back the report write.
+                    if end_row_existing - start_row_existing + 1 != len(formatted_report_values):
+                        tag_report_rows(sheet, SPREADSHEET_ID, report_sheet_id, start_row_existing,
+                                        len(formatted_report_values), today_date_str_for_report)
 
                 except HttpError as e:
                     logger.error(f"API Error while updating report: {e}")
+                    # The sheet may have been deleted and re-created; resolve its id again next time
+                    forget_sheet_id(SPREADSHEET_ID, REPORT_SHEET_NAME)
                 except Exception as e:
                      logger.exception("Unexpected error while updating report:")
 
@@ -488,31 +670,39 @@ def distribute_and_report():
                 logger.info(f"No existing report for {today_date_str_for_report}. Appending new report...")
 
                 start_row_for_append = 1
-                try:
-                     result_existing_report = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A').execute()
-                     existing_values = result_existing_report.get('values', [])
-                     if existing_values:
-                         start_row_for_append = len(existing_values) + 1
-                     logger.info(f"Found {len(existing_values)} existing rows. New report starts at row {start_row_for_append}.")
+                report_sheet_id = None
+                if report_last_row is not None:
+                    # Column A was already read while searching for today's report
+                    start_row_for_append = report_last_row + 1
+                    logger.info(f"Found {report_last_row} existing rows. New report starts at row {start_row_for_append}.")
+                else:
+                    try:
+                        result_existing_report = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=f'{REPORT_SHEET_NAME}!A:A').execute()
+                        existing_values = result_existing_report.get('values', [])
+                        if existing_values:
+                            start_row_for_append = len(existing_values) + 1
+                        logger.info(f"Found {len(existing_values)} existing rows. New report starts at row {start_row_for_append}.")
 
-                except HttpError as e:
-                     if 'Unable to parse range' in str(e) or e.resp.status == 400:
-                          logger.warning(f"Sheet '{REPORT_SHEET_NAME}' not found when checking append position. Creating it.")
-                          try:
-                              body = {'requests': [{'addSheet': {'properties': {'title': REPORT_SHEET_NAME}}}]}
-                              sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
-                              logger.info(f"Created sheet '{REPORT_SHEET_NAME}'. Report starts at row {start_row_for_append}.")
-                          except Exception as create_err:
-                               logger.error(f"Error creating sheet '{REPORT_SHEET_NAME}': {create_err}")
-                               logger.error("Cannot proceed with report. Aborting.")
-                               return None
-
-                     else:
-                         logger.error(f"API Error while checking/reading sheet for append: {e}")
-                         raise
-                except Exception as e:
-                     logger.exception(f"Unexpected error while finding last row:")
-                     return None
+                    except HttpError as e:
+                        if 'Unable to parse range' in str(e) or e.resp.status == 400:
+                            logger.warning(f"Sheet '{REPORT_SHEET_NAME}' not found when checking append position. Creating it.")
+                            try:
+                                body = {'requests': [{'addSheet': {'properties': {'title': REPORT_SHEET_NAME}}}]}
+                                result = sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=body).execute()
+                                report_sheet_id = result['replies'][0]['addSheet']['properties']['sheetId']
+                                _sheet_id_cache[(SPREADSHEET_ID, REPORT_SHEET_NAME)] = report_sheet_id
+                                logger.info(f"Created sheet '{REPORT_SHEET_NAME}'. Report starts at row {start_row_for_append}.")
+                            except Exception as create_err:
+                                logger.error(f"Error creating sheet '{REPORT_SHEET_NAME}': {create_err}")
+                                logger.error("Cannot proceed with report. Aborting.")
+                                return None
+
+                        else:
+                            logger.error(f"API Error while checking/reading sheet for append: {e}")
+                            raise
+                    except Exception as e:
+                        logger.exception(f"Unexpected error while finding last row:")
+                        return None
 
                 if formatted_report_values:
                     body = {'values': formatted_report_values}
@@ -523,6 +713,12 @@ def distribute_and_report():
                             spreadsheetId=SPREADSHEET_ID, range=range_to_write_report,
                             valueInputOption='RAW', body=body).execute()
                         logger.info(f"Report written. {result.get('updatedCells', 'N/A')} cells updated.")
+                        write_report_digest(today_date_str_for_report, report_digest)
+
+                        if report_sheet_id is None:
+                            report_sheet_id = get_sheet_id(sheet, SPREADSHEET_ID, REPORT_SHEET_NAME)
+                        tag_report_rows(sheet, SPREADSHEET_ID, report_sheet_id, start_row_for_append,
+                                        len(formatted_report_values), today_date_str_for_report)
                     except HttpError as e:
                         logger.error(f"API Error while writing report: {e}")
                     except Exception as e:
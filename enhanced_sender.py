@@ -1,92 +1,325 @@
-import requests
+import asyncio
+import httpx
+import orjson
+import socket
+import urllib3
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import heapq
+import io
+import itertools
 import json
+import threading
 import time
 import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, NamedTuple, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
-class EnhancedWAHAClient:
-    def __init__(self, base_url: str = "http://23.23.209.128", session: str = "us-phone-bot"):
+# (connect, read) timeouts for WAHA API calls, in seconds
+REQUEST_TIMEOUT = (3, 10)
+
+# Pooled sockets: no Nagle delay on the small typing/sendText writes, and keepalive
+# probes so idle pooled connections are noticed before they are reused
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+# Keepalive timing options are not available on every platform
+if hasattr(socket, "TCP_KEEPIDLE"):
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+if hasattr(socket, "TCP_KEEPINTVL"):
+    SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+
+class StakeholderRow(NamedTuple):
+    """Per-stakeholder call counts for one report run"""
+    name: str = "Unknown"
+    total: int = 0
+    fresh: int = 0
+    abandoned: int = 0
+    invalid_fake: int = 0
+    cnp: int = 0
+    follow_up: int = 0
+    ndr: int = 0
+
+    @classmethod
+    def from_raw(cls, raw: Mapping[str, Any]) -> "StakeholderRow":
+        """Build a row from a loosely-typed mapping, coercing counts to int and defaulting missing ones to 0"""
+        return cls(str(raw.get("name") or "Unknown"), *(int(raw.get(field) or 0) for field in cls._fields[1:]))
+
+def _format_stakeholder_block(row: StakeholderRow) -> str:
+    """One stakeholder block of the report message, including the blank separator line"""
+    return (
+        f"Calls assigned {row.name}\n"
+        f"- Total Calls This Run - {row.total}\n"
+        f"- Fresh - {row.fresh}\n"
+        f"- Abandoned - {row.abandoned}\n"
+        f"- Invalid/Fake - {row.invalid_fake}\n"
+        f"- CNP - {row.cnp}\n"
+        f"- Follow up - {row.follow_up}\n"
+        f"- NDR - {row.ndr}\n"
+        "\n"
+    )
+
+def _report_typing_time(message: str) -> float:
+    """Typing delay for a report: scales with message length, capped at 3 seconds"""
+    return min(3.0, len(message) / 400)
+
+@functools.lru_cache(maxsize=32)
+def _format_report_cached(rows: Tuple[StakeholderRow, ...], date_str: str) -> str:
+    """Build the report message. Cached so retried or repeated sends reuse the string."""
+    buf = io.StringIO()
+    buf.write(f"--- Stakeholder Report for Assignments on {date_str} ---\n\n")
+    buf.writelines(_format_stakeholder_block(row) for row in rows)
+    buf.write(f"--- End of Report for {date_str} ---")
+    return buf.getvalue()
+
+@functools.lru_cache(maxsize=1024)
+def _format_chat_id(chat_id: str) -> str:
+    """Normalize a chat id to its WAHA form. Cached, since the same ids are re-formatted on every call."""
+    if not (chat_id.endswith('@c.us') or chat_id.endswith('@g.us')):
+        # If it contains @g.us, it's a group
+        if '@g.us' in chat_id:
+            return chat_id
+        # Otherwise, it's a personal chat
+        return f"{chat_id}@c.us"
+    return chat_id
+
+@functools.lru_cache(maxsize=1024)
+def _typing_payload(chat_id: str, session: str) -> bytes:
+    """Encoded startTyping/stopTyping body for a normalized chat id, built once per chat"""
+    return orjson.dumps({"chatId": chat_id, "session": session})
+
+class _WAHAClientBase:
+    """Transport-independent helpers shared by the sync and async WAHA clients"""
+
+    def __init__(self, base_url: str, session: str):
         self.base_url = base_url
         self.session = session
+        # Prebuilt sendText payload skeleton, copied and filled in per call
+        self._message_template = {"session": session}
+
+    def _format_chat_id(self, chat_id: str) -> str:
+        return _format_chat_id(chat_id)
+
+    def _typing_payload(self, chat_id: str) -> bytes:
+        """Encoded body shared by startTyping and stopTyping for chat_id"""
+        return _typing_payload(self._format_chat_id(chat_id), self.session)
+
+    def _format_stakeholder_report(self, report_data: Sequence[StakeholderRow], date_str: str) -> str:
+        """
+        Format stakeholder report data into a readable message
+        
+        Args:
+            report_data: StakeholderRow records containing stakeholder report data
+            date_str: Date string for the report
+            
+        Returns:
+            Formatted message string
+        """
+        return _format_report_cached(tuple(report_data), date_str)
+
+
+class EnhancedWAHAClient(_WAHAClientBase):
+    def __init__(self, base_url: str = "http://23.23.209.128", session: str = "us-phone-bot", max_workers: int = 8):
+        super().__init__(base_url, session)
+
+        # Background workers for fire-and-forget typing indicators and concurrent sends
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="waha")
+        # Pending delayed sends from schedule_message_with_typing: a (due, seq, args) heap
+        # drained by a single scheduler thread, so waiting sends don't hold a thread each
+        self._scheduled = []
+        self._schedule_seq = itertools.count()
+        self._schedule_cond = threading.Condition()
+        self._scheduler = None
+        self._closing = False
+
+        # One urllib3 pool so consecutive calls reuse the same keep-alive connection,
+        # without requests' per-call PreparedRequest/hook/environment handling.
+        # Transient WAHA failures are retried inside urllib3 on the pooled connection;
+        # POST must be allowed explicitly since urllib3 only retries idempotent methods by default.
+        # Read and other errors are not retried: the request may already have been
+        # delivered, and resending sendText would duplicate the message.
+        retry = Retry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+        )
+        # Bodies are posted as bytes so Content-Length is set up front (no chunked framing)
+        self._pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=32,
+            headers={"Content-Type": "application/json", "Connection": "keep-alive"},
+            retries=retry,
+            timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT[0], read=REQUEST_TIMEOUT[1]),
+            socket_options=SOCKET_OPTIONS,
+        )
+
+    def close(self) -> None:
+        """Wait for pending sends, stop the background workers and close the pooled HTTP connections"""
+        with self._schedule_cond:
+            self._closing = True
+            scheduler = self._scheduler
+            self._schedule_cond.notify()
+        if scheduler is not None:
+            scheduler.join()
+        self._executor.shutdown(wait=True)
+        self._pool.clear()
+
+    def __enter__(self) -> "EnhancedWAHAClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict]:
         """Make a request to WAHA API"""
+        # Serialize with orjson; the pool already sends Content-Type: application/json
+        return self._post(endpoint, orjson.dumps(payload))
+
+    def _post(self, endpoint: str, body: bytes) -> Optional[Dict]:
+        """POST an already-encoded JSON body to WAHA API"""
         url = f"{self.base_url}/api/{endpoint}"
         try:
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            response = self._pool.urlopen("POST", url, body=body)
+            if not 200 <= response.status < 300:
+                logger.error(f"Error in API request to {endpoint}: HTTP {response.status}")
+                return None
+            return orjson.loads(response.data)
+        except (urllib3.exceptions.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"Error in API request to {endpoint}: {e}")
             return None
 
-    def _format_chat_id(self, chat_id: str) -> str:
-        if not (chat_id.endswith('@c.us') or chat_id.endswith('@g.us')):
-            # If it contains @g.us, it's a group
-            if '@g.us' in chat_id:
-                return chat_id
-            # Otherwise, it's a personal chat
-            return f"{chat_id}@c.us"
-        return chat_id
-
-    def send_message_with_typing(self, chat_id: str, message: str, typing_time: int = 2) -> Optional[Dict]:
-        """Send a message with typing indicator"""
+    def send_message_with_typing(self, chat_id: str, message: str, typing_time: float = 2) -> Optional[Dict]:
+        """
+        Send a message with typing indicator
+
+        Blocking wrapper around schedule_message_with_typing.
+        """
+        return self.schedule_message_with_typing(chat_id, message, typing_time).result()
+
+    def schedule_message_with_typing(self, chat_id: str, message: str, typing_time: float = 2) -> Future:
+        """
+        Start the typing indicator and send the message after typing_time without blocking
+
+        startTyping is issued in the background and the message is queued on the
+        client's scheduler thread, which hands it to the worker pool once the delay
+        has elapsed. No thread is held while the delay runs.
+        No stopTyping is sent: WAHA clears the typing state when the message arrives.
+
+        Returns:
+            Future resolving to the sendText API response (None on failure)
+        """
         chat_id = self._format_chat_id(chat_id)
-        
+        done = Future()
+
         try:
-            # Start typing
-            self.start_typing(chat_id)
-            
-            # Wait for specified typing time
-            time.sleep(typing_time)
-            
-            # Stop typing
-            self.stop_typing(chat_id)
-            
-            # Send message
-            result = self.send_message(chat_id, message)
-            
-            return result
-            
+            # Start typing in the background
+            typing_future = self._executor.submit(self.start_typing, chat_id)
+
+            # Send once the typing time has elapsed
+            self._schedule(typing_time, (typing_future, chat_id, message, done))
+
         except Exception as e:
             logger.error(f"Error in send_message_with_typing: {e}")
+            done.set_result(None)
+
+        return done
+
+    def _schedule(self, delay: float, args: Tuple) -> None:
+        """Queue a _send_after_typing call to run after delay seconds"""
+        with self._schedule_cond:
+            if self._closing:
+                raise RuntimeError("client is closed")
+            heapq.heappush(self._scheduled, (time.monotonic() + delay, next(self._schedule_seq), args))
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._run_scheduler, name="waha-scheduler", daemon=True)
+                self._scheduler.start()
+            self._schedule_cond.notify()
+
+    def _run_scheduler(self) -> None:
+        """Scheduler thread: dispatch queued sends to the worker pool as they come due"""
+        while True:
+            with self._schedule_cond:
+                while True:
+                    if not self._scheduled:
+                        if self._closing:
+                            return
+                        self._schedule_cond.wait()
+                        continue
+                    wait = self._scheduled[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._schedule_cond.wait(wait)
+                _, _, args = heapq.heappop(self._scheduled)
+            self._executor.submit(self._send_after_typing, *args)
+
+    def _send_after_typing(self, typing_future: Future, chat_id: str, message: str, done: Future) -> None:
+        """Send a scheduled message from schedule_message_with_typing"""
+        try:
+            # Make sure startTyping has landed before the message so the indicator can't outlive it
+            typing_future.result()
+            done.set_result(self.send_message(chat_id, message))
+
+        except Exception as e:
+            logger.error(f"Error in send_message_with_typing: {e}")
+            done.set_result(None)
+
+    def send_many(self, messages: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        Send several messages concurrently over the connection pool
+
+        Args:
+            messages: List of (chat_id, message) tuples
+
+        Returns:
+            API responses in the same order as messages (None for failed sends)
+        """
+        return list(self._executor.map(lambda item: self.send_message(*item), messages))
+
+    def send_batch(self, chat_id: str, messages: List[str], separator: str = "\n\n") -> Optional[Dict]:
+        """
+        Send several messages for one chat as a single sendText
+
+        Args:
+            chat_id: Destination chat ID
+            messages: Message texts, joined in order
+            separator: Text placed between consecutive messages
+
+        Returns:
+            API response as a dictionary (None if nothing was sent or the send failed)
+        """
+        if not messages:
             return None
+        return self.send_message(chat_id, separator.join(messages))
 
     def send_message(self, chat_id: str, message: str) -> Optional[Dict]:
         """Send a message"""
-        payload = {
-            "chatId": self._format_chat_id(chat_id),
-            "text": message,
-            "session": self.session
-        }
+        payload = self._message_template.copy()
+        payload["chatId"] = self._format_chat_id(chat_id)
+        payload["text"] = message
         return self._make_request("sendText", payload)
 
     def start_typing(self, chat_id: str) -> Optional[Dict]:
         """Start typing indicator"""
-        payload = {
-            "chatId": self._format_chat_id(chat_id),
-            "session": self.session
-        }
-        return self._make_request("startTyping", payload)
+        return self._post("startTyping", self._typing_payload(chat_id))
 
     def stop_typing(self, chat_id: str) -> Optional[Dict]:
         """Stop typing indicator"""
-        payload = {
-            "chatId": self._format_chat_id(chat_id),
-            "session": self.session
-        }
-        return self._make_request("stopTyping", payload)
+        return self._post("stopTyping", self._typing_payload(chat_id))
 
-    def send_stakeholder_report(self, group_id: str, report_data: List[Dict[str, Any]], date_str: Optional[str] = None) -> Optional[Dict]:
+    def send_stakeholder_report(self, group_id: str, report_data: Sequence[StakeholderRow], date_str: Optional[str] = None) -> Optional[Dict]:
         """
         Send a formatted stakeholder report to a WhatsApp group
         
         Args:
             group_id: WhatsApp group ID (e.g., '120363418230720597@g.us')
-            report_data: List of dictionaries containing stakeholder report data
+            report_data: StakeholderRow records containing stakeholder report data
             date_str: Optional date string for the report (defaults to today's date)
             
         Returns:
@@ -100,51 +333,206 @@ class EnhancedWAHAClient:
         
         # Send the message to the group
         logger.info(f"Sending stakeholder report to group {group_id}")
-        return self.send_message_with_typing(group_id, message, typing_time=3)
-    
-    def _format_stakeholder_report(self, report_data: List[Dict[str, Any]], date_str: str) -> str:
-        """
-        Format stakeholder report data into a readable message
         
+        # Nothing to report: skip the typing indicator and its delay
+        if not report_data:
+            return self.send_message(group_id, message)
+        
+        return self.send_message_with_typing(group_id, message, typing_time=_report_typing_time(message))
+
+
+class FlushingSender:
+    """
+    Coalesces messages for the same chat into fewer sendText calls
+
+    Messages are buffered per chat and sent through EnhancedWAHAClient.send_batch
+    once flush_interval_ms has passed since the first buffered message, or as soon
+    as the buffered text reaches max_bytes.
+    """
+
+    def __init__(self, client: EnhancedWAHAClient, flush_interval_ms: int = 100, max_bytes: int = 3500, separator: str = "\n\n"):
+        self.client = client
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_bytes = max_bytes
+        self.separator = separator
+        self._separator_size = len(separator.encode("utf-8"))
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, List[str]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def send(self, chat_id: str, message: str) -> None:
+        """Queue a message for chat_id"""
+        chat_id = _format_chat_id(chat_id)
+        size = len(message.encode("utf-8"))
+        ready = []
+
+        with self._lock:
+            buffered = self._buffers.get(chat_id)
+            # Flush first if this message would push the batch past max_bytes
+            if buffered and self._sizes[chat_id] + self._separator_size + size > self.max_bytes:
+                ready.append(self._take(chat_id))
+                buffered = None
+
+            if buffered:
+                buffered.append(message)
+                self._sizes[chat_id] += self._separator_size + size
+            else:
+                self._buffers[chat_id] = [message]
+                self._sizes[chat_id] = size
+
+            if self._sizes[chat_id] >= self.max_bytes:
+                ready.append(self._take(chat_id))
+            elif chat_id not in self._timers:
+                timer = threading.Timer(self.flush_interval, self._flush_chat, args=(chat_id,))
+                timer.daemon = True
+                self._timers[chat_id] = timer
+                timer.start()
+
+        for messages in ready:
+            self.client.send_batch(chat_id, messages, self.separator)
+
+    def flush(self) -> None:
+        """Send everything that is currently buffered"""
+        with self._lock:
+            ready = [(chat_id, self._take(chat_id)) for chat_id in list(self._buffers)]
+
+        for chat_id, messages in ready:
+            self.client.send_batch(chat_id, messages, self.separator)
+
+    def close(self) -> None:
+        """Flush any buffered messages"""
+        self.flush()
+
+    def __enter__(self) -> "FlushingSender":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _take(self, chat_id: str) -> List[str]:
+        """Remove and return the buffer for chat_id; the caller must hold the lock"""
+        timer = self._timers.pop(chat_id, None)
+        if timer is not None:
+            timer.cancel()
+        self._sizes.pop(chat_id, None)
+        return self._buffers.pop(chat_id)
+
+    def _flush_chat(self, chat_id: str) -> None:
+        """Timer callback: send the buffer for chat_id once the flush window closes"""
+        with self._lock:
+            if self._timers.get(chat_id) is not threading.current_thread():
+                return
+            messages = self._take(chat_id)
+
+        self.client.send_batch(chat_id, messages, self.separator)
+
+
+class AsyncEnhancedWAHAClient(_WAHAClientBase):
+    """
+    asyncio counterpart of EnhancedWAHAClient
+
+    A single httpx.AsyncClient (and its connection pool) is shared by every call,
+    so many messages can be in flight at once instead of one socket at a time.
+    """
+
+    def __init__(self, base_url: str = "http://23.23.209.128", session: str = "us-phone-bot"):
+        super().__init__(base_url, session)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=10.0,
+            # Pool limits belong on the transport: AsyncClient ignores limits= when transport= is given
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncEnhancedWAHAClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Dict]:
+        """Make a request to WAHA API"""
+        return await self._post(endpoint, orjson.dumps(payload))
+
+    async def _post(self, endpoint: str, body: bytes) -> Optional[Dict]:
+        """POST an already-encoded JSON body to WAHA API"""
+        try:
+            response = await self._client.post(f"/api/{endpoint}", content=body)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error in API request to {endpoint}: {e}")
+            return None
+
+    async def send_message_with_typing(self, chat_id: str, message: str, typing_time: float = 2) -> Optional[Dict]:
+        """Send a message with typing indicator (startTyping overlaps the typing delay)"""
+        chat_id = self._format_chat_id(chat_id)
+
+        try:
+            typing_task = asyncio.create_task(self.start_typing(chat_id))
+            await asyncio.sleep(typing_time)
+            await typing_task
+            return await self.send_message(chat_id, message)
+
+        except Exception as e:
+            logger.error(f"Error in send_message_with_typing: {e}")
+            return None
+
+    async def send_many(self, messages: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        Send several messages concurrently
+
         Args:
-            report_data: List of dictionaries containing stakeholder report data
-            date_str: Date string for the report
-            
+            messages: List of (chat_id, message) tuples
+
         Returns:
-            Formatted message string
+            API responses in the same order as messages (None for failed sends)
         """
-        message_lines = [
-            f"--- Stakeholder Report for Assignments on {date_str} ---",
-            ""
-        ]
-        
-        for stakeholder in report_data:
-            name = stakeholder.get("name", "Unknown")
-            total = stakeholder.get("total", 0)
-            fresh = stakeholder.get("fresh", 0)
-            abandoned = stakeholder.get("abandoned", 0)
-            invalid_fake = stakeholder.get("invalid_fake", 0)
-            cnp = stakeholder.get("cnp", 0)
-            follow_up = stakeholder.get("follow_up", 0)
-            ndr = stakeholder.get("ndr", 0)
-            
-            stakeholder_lines = [
-                f"Calls assigned {name}",
-                f"- Total Calls This Run - {total}",
-                f"- Fresh - {fresh}",
-                f"- Abandoned - {abandoned}",
-                f"- Invalid/Fake - {invalid_fake}",
-                f"- CNP - {cnp}",
-                f"- Follow up - {follow_up}",
-                f"- NDR - {ndr}",
-                ""
-            ]
-            
-            message_lines.extend(stakeholder_lines)
-        
-        message_lines.append(f"--- End of Report for {date_str} ---")
-        
-        return "\n".join(message_lines)
+        return list(await asyncio.gather(*[self.send_message(chat_id, message) for chat_id, message in messages]))
+
+    async def send_batch(self, chat_id: str, messages: List[str], separator: str = "\n\n") -> Optional[Dict]:
+        """Send several messages for one chat as a single sendText (see EnhancedWAHAClient.send_batch)"""
+        if not messages:
+            return None
+        return await self.send_message(chat_id, separator.join(messages))
+
+    async def send_message(self, chat_id: str, message: str) -> Optional[Dict]:
+        """Send a message"""
+        payload = self._message_template.copy()
+        payload["chatId"] = self._format_chat_id(chat_id)
+        payload["text"] = message
+        return await self._make_request("sendText", payload)
+
+    async def start_typing(self, chat_id: str) -> Optional[Dict]:
+        """Start typing indicator"""
+        return await self._post("startTyping", self._typing_payload(chat_id))
+
+    async def stop_typing(self, chat_id: str) -> Optional[Dict]:
+        """Stop typing indicator"""
+        return await self._post("stopTyping", self._typing_payload(chat_id))
+
+    async def send_stakeholder_report(self, group_id: str, report_data: Sequence[StakeholderRow], date_str: Optional[str] = None) -> Optional[Dict]:
+        """Send a formatted stakeholder report to a WhatsApp group (see EnhancedWAHAClient.send_stakeholder_report)"""
+        if not date_str:
+            date_str = datetime.date.today().strftime("%d-%b-%Y")
+
+        message = self._format_stakeholder_report(report_data, date_str)
+
+        logger.info(f"Sending stakeholder report to group {group_id}")
+
+        if not report_data:
+            return await self.send_message(group_id, message)
+
+        return await self.send_message_with_typing(group_id, message, typing_time=_report_typing_time(message))
 
 
 # Test the client if run directly
@@ -159,36 +547,9 @@ if __name__ == "__main__":
     
     # Sample stakeholder report data
     sample_report = [
-        {
-            "name": "Deepasha",
-            "total": 100,
-            "fresh": 14,
-            "abandoned": 53,
-            "invalid_fake": 6,
-            "cnp": 23,
-            "follow_up": 1,
-            "ndr": 3
-        },
-        {
-            "name": "Khushi",
-            "total": 100,
-            "fresh": 14,
-            "abandoned": 53,
-            "invalid_fake": 5,
-            "cnp": 28,
-            "follow_up": 0,
-            "ndr": 0
-        },
-        {
-            "name": "Komal",
-            "total": 100,
-            "fresh": 13,
-            "abandoned": 53,
-            "invalid_fake": 9,
-            "cnp": 21,
-            "follow_up": 2,
-            "ndr": 2
-        }
+        StakeholderRow(name="Deepasha", total=100, fresh=14, abandoned=53, invalid_fake=6, cnp=23, follow_up=1, ndr=3),
+        StakeholderRow(name="Khushi", total=100, fresh=14, abandoned=53, invalid_fake=5, cnp=28, follow_up=0, ndr=0),
+        StakeholderRow(name="Komal", total=100, fresh=13, abandoned=53, invalid_fake=9, cnp=21, follow_up=2, ndr=2)
     ]
     
     # Test date
@@ -8,23 +8,48 @@ This application provides:
 
 import os
 import sys
+import atexit
+import queue
+import asyncio
 import logging
 import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # Add the project root to the path to ensure imports work correctly
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('wabiz_sender.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Log calls only enqueue records; a background listener thread does the file and
+# stdout writes so they never block the send path.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('wabiz_sender.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# Leave full formatting to the listener's handlers
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Imported after logging is configured: data.distribution calls logging.basicConfig
+# at import time, which must find the root logger already set up
+from data.distribution import distribute_and_report
+from enhanced_sender import AsyncEnhancedWAHAClient, StakeholderRow
+
+# Fall back to generated report data when Google Sheets returns nothing;
+# set to False to skip sending in that case
+USE_FAKE_DATA = True
+
 def generate_fake_stakeholder_report():
     """Generate fake stakeholder report data for testing purposes."""
     logger.info("Generating fake stakeholder report data for testing...")
@@ -59,38 +84,35 @@ def generate_fake_stakeholder_report():
     
     return fake_report
 
+# (StakeholderRow field, report category) pairs
+_KEY_MAP = (
+    ("total", "Total"),
+    ("fresh", "Fresh"),
+    ("abandoned", "Abandoned"),
+    ("invalid_fake", "Invalid/Fake"),
+    ("cnp", "CNP"),
+    ("follow_up", "Follow up"),
+    ("ndr", "NDR"),
+)
+
 def convert_report_format(report_dict):
     """
-    Convert the report from dictionary format to list of dictionaries format
-    that is expected by send_stakeholder_report method
+    Convert the report from dictionary format to the list of StakeholderRow
+    records that is expected by send_stakeholder_report method.
+    Every count is present and an int, so formatting needs no fallbacks.
     """
     if not report_dict:
         return []
-        
-    report_list = []
-    for name, counts in report_dict.items():
-        stakeholder_data = {
-            "name": name,
-            "total": counts.get("Total", 0),
-            "fresh": counts.get("Fresh", 0),
-            "abandoned": counts.get("Abandoned", 0),
-            "invalid_fake": counts.get("Invalid/Fake", 0),
-            "cnp": counts.get("CNP", 0),
-            "follow_up": counts.get("Follow up", 0),
-            "ndr": counts.get("NDR", 0)
-        }
-        report_list.append(stakeholder_data)
     
-    return report_list
+    return [
+        StakeholderRow(name=name, **{dst: int(counts.get(src, 0)) for dst, src in _KEY_MAP})
+        for name, counts in report_dict.items()
+    ]
 
-def main():
+async def main():
     """Main entry point for the application."""
     logger.info("WAbizSender - Starting application")
     
-    # Import here to avoid circular imports
-    from data.distribution import distribute_and_report
-    from enhanced_sender import EnhancedWAHAClient
-    
     # Run the distribution script to process data and generate report
     logger.info("Processing data from Google Sheets...")
     
@@ -99,26 +121,31 @@ def main():
     
     # Check if we got valid data back
     if not stakeholder_report:
+        if not USE_FAKE_DATA:
+            logger.warning("No real data available from Google Sheets. Skipping WhatsApp report.")
+            return
         logger.warning("No real data available from Google Sheets. Using fake data instead.")
         stakeholder_report = generate_fake_stakeholder_report()
     
-    # Convert the report format to what send_stakeholder_report expects
-    formatted_report = convert_report_format(stakeholder_report)
+    # distribute_and_report already returns rows keyed by StakeholderRow field names
+    # and is validated once here; the dictionary-shaped fake data goes through convert_report_format
+    if isinstance(stakeholder_report, dict):
+        formatted_report = convert_report_format(stakeholder_report)
+    else:
+        formatted_report = [StakeholderRow.from_raw(row) for row in stakeholder_report]
     
     # Now send the report to WhatsApp
     logger.info("Sending stakeholder report to WhatsApp group...")
     
-    # Initialize WhatsApp client
-    whatsapp_client = EnhancedWAHAClient()
-    
     # Target WhatsApp group (Giant Leap group from the plan)
     group_id = "120363418230720597@g.us"
     
     # Get today's date for the report
     today_date = datetime.date.today().strftime("%d-%b-%Y")
     
-    # Send the report to WhatsApp using the properly formatted data
-    result = whatsapp_client.send_stakeholder_report(group_id, formatted_report, today_date)
+    # Initialize WhatsApp client and send the report using the properly formatted data
+    async with AsyncEnhancedWAHAClient() as whatsapp_client:
+        result = await whatsapp_client.send_stakeholder_report(group_id, formatted_report, today_date)
     
     if result:
         logger.info("Successfully sent stakeholder report to WhatsApp group")
@@ -126,4 +153,4 @@ def main():
         logger.error("Failed to send stakeholder report to WhatsApp group")
     
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
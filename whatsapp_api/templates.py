@@ -1,7 +1,26 @@
 # Message templates for WhatsApp API
 # Clean, reusable, and easy to extend for new scenarios
 
-from typing import Dict
+import functools
+import string
+from typing import Dict, Optional, Tuple
+
+# Template split into (literal text, placeholder name or None) pairs
+Segments = Tuple[Tuple[str, Optional[str]], ...]
+
+@functools.lru_cache(maxsize=64)
+def _parse_template(template: str) -> Optional[Segments]:
+    """
+    Tokenize a template once.
+    Returns None for templates using format specs, conversions or non-identifier
+    fields, which are rendered with str.format instead.
+    """
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
 
 class MessageTemplates:
     # COD Confirmation template
@@ -33,11 +52,21 @@ class MessageTemplates:
         :param data: Dictionary with keys matching placeholders.
         :return: Rendered message string.
         """
+        segments = _parse_template(template)
         try:
-            return template.format(**data)
+            if segments is None:
+                return template.format(**data)
+            return "".join(
+                literal + (str(data[field]) if field is not None else "")
+                for literal, field in segments
+            )
         except KeyError as e:
             raise ValueError(f"Missing placeholder in data: {e}")
 
+# Tokenize the built-in templates up front
+for _template in (MessageTemplates.COD_CONFIRMATION, MessageTemplates.PROMO_MESSAGE):
+    _parse_template(_template)
+
 # Example usage:
 # msg = MessageTemplates.render(MessageTemplates.COD_CONFIRMATION, {
 #     "name": "Shruti",
@@ -46,4 +75,4 @@ class MessageTemplates:
 #     "amount": "619.05",
 #     "product_name": "Caaju™ Smart Lakh Saver Challenge Money Box"
 # })
-# print(msg)
\ No newline at end of file
+# print(msg)